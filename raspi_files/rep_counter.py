@@ -1,30 +1,44 @@
 import math
 
+# integer states: cheap to compare per sample; STATE_NAMES maps back for display
+WAITING = 0
+MOVING = 1
+STATE_NAMES = ("WAITING", "MOVING")
+
 class RepCounter:
     def __init__(self, threshold=1200.0, min_rep_time=0.6, alpha=0.2):
         self.threshold = threshold
         self.min_rep_time = min_rep_time
         self.alpha = alpha
 
+        # precomputed per-sample constants
+        self._beta = 1.0 - alpha
+        self._release = threshold * 0.6
+
         self.filtered = 0.0
-        self.state = "WAITING"
+        self.state = WAITING
         self.last_rep_time = 0.0
         self.reps = 0
 
+    @property
+    def state_name(self):
+        return STATE_NAMES[self.state]
+
     def update(self, gx, gy, gz, t):
-        mag = math.sqrt(gx*gx + gy*gy + gz*gz)
-        self.filtered = self.alpha * mag + (1 - self.alpha) * self.filtered
+        mag = math.hypot(gx, gy, gz)
+        filtered = self.alpha * mag + self._beta * self.filtered
+        self.filtered = filtered
 
-        if self.state == "WAITING":
-            if self.filtered > self.threshold:
-                self.state = "MOVING"
+        if self.state == WAITING:
+            if filtered > self.threshold:
+                self.state = MOVING
 
-        elif self.state == "MOVING":
+        elif self.state == MOVING:
             # drop below hysteresis to end the rep
-            if self.filtered < self.threshold * 0.6:
+            if filtered < self._release:
                 if (t - self.last_rep_time) >= self.min_rep_time:
                     self.reps += 1
                     self.last_rep_time = t
-                self.state = "WAITING"
+                self.state = WAITING
 
-        return self.reps, self.filtered, self.state
\ No newline at end of file
+        return self.reps, filtered, self.state
\ No newline at end of file
@@ -15,21 +15,29 @@ def main():
     print("\n--- REP COUNTER (BENCH MVP) ---")
     print("Move the IMU up/down. Ctrl+C to stop.\n")
 
-    t0 = time.time()
+    period_ns = 20_000_000  # ~50Hz
+    t0_ns = time.monotonic_ns()
+    next_ns = t0_ns
     last_print = 0.0
 
     try:
         while True:
-            t = time.time() - t0
+            t = (time.monotonic_ns() - t0_ns) / 1e9
             ax, ay, az, gx, gy, gz = imu.read_accel_gyro()
 
-            reps, filt, state = counter.update(gx, gy, gz, t)
+            reps, filt, _state = counter.update(gx, gy, gz, t)
 
             if t - last_print > 0.2:  # print 5x/sec
-                print(f"reps={reps:3d}  filt={filt:7.1f}  state={state}")
+                print(f"reps={reps:3d}  filt={filt:7.1f}  state={counter.state_name}")
                 last_print = t
 
-            time.sleep(0.02)  # ~50Hz
+            # sleep to the next absolute deadline so loop work doesn't add drift
+            next_ns += period_ns
+            sleep_ns = next_ns - time.monotonic_ns()
+            if sleep_ns > 0:
+                time.sleep(sleep_ns / 1e9)
+            else:
+                next_ns = time.monotonic_ns()  # fell behind; don't burst to catch up
     except KeyboardInterrupt:
         print("\n--- STOP ---")
         print("Total reps:", counter.reps)
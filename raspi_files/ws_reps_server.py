@@ -1,13 +1,23 @@
-import asyncio, json, time, os, platform
+import asyncio, functools, json, time, os, platform
 import websockets
 from datetime import datetime, timezone
 
-import zipfile
 import threading
 from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from imu_driver import IMU
-from rep_counter import RepCounter
+from rep_counter import RepCounter, MOVING as COUNTER_MOVING
 
 HOST = "0.0.0.0"
 PORT = 8765
@@ -20,6 +30,14 @@ os.makedirs(EXPORT_DIR, exist_ok=True)
 
 clients = set()
 
+# clients with more than this still queued in the socket are behind;
+# they skip rep_update ticks (the next one supersedes it) until they drain
+SLOW_CLIENT_BACKLOG_BYTES = 64 * 1024
+
+# raw.jsonl is written in batches; Session.stop() flushes the remainder
+LOG_FLUSH_BYTES = 8 * 1024
+LOG_FLUSH_SEC = 1.0
+
 STATE_CALIBRATING = "CALIBRATING"
 STATE_WAITING = "WAITING"
 STATE_MOVING = "MOVING"
@@ -40,12 +58,21 @@ LAST_STATUS = {
 
 RESET_REQUESTED = False
 
+# built once by imu_loop; must stay JSON-safe, since write_summary and
+# export_session_zip embed them without sanitizing
 SERVER_DEVICE_INFO = {}
 SERVER_THRESHOLDS = {}
 
 _http_thread = None
 _http_port = None
 
+# encoded LAST_STATUS; cleared whenever imu_loop replaces the snapshot
+_last_status_json = None
+
+# last encoded session_raw reply and the (request, raw.jsonl stat) it matches
+_raw_reply_key = None
+_raw_reply_json = None
+
 
 # -----------------------------
 # Helpers
@@ -56,6 +83,7 @@ def iso_from_ts(ts: float) -> str:
 def make_session_id() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%SZ")
 
+@functools.lru_cache(maxsize=1)
 def read_pi_model() -> str:
     try:
         with open("/proc/device-tree/model", "r") as f:
@@ -70,16 +98,36 @@ def safe_getattr(obj, name, default=None):
         return default
 
 def json_safe(x):
-    if x is None:
-        return None
-    if isinstance(x, (str, int, float, bool)):
+    # exact-type checks first: the common leaves skip the isinstance MRO walk
+    t = type(x)
+    if x is None or t is str or t is float or t is int or t is bool:
+        return x
+    if isinstance(x, (str, int, float)):
         return x
     if isinstance(x, (list, tuple)):
         return [json_safe(v) for v in x]
     if isinstance(x, dict):
-        return {str(k): json_safe(v) for k, v in x.items()}
+        return {k if type(k) is str else str(k): json_safe(v) for k, v in x.items()}
     return str(x)
 
+if orjson is not None:
+    def dumps(obj) -> str:
+        # text frames: the app JSON.parse()s event.data, so keep str not bytes
+        return orjson.dumps(obj).decode("utf-8")
+
+    loads = orjson.loads
+else:
+    dumps = json.dumps
+    loads = json.loads
+
+def write_all(fd: int, data) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def round_or_none(x, n):
+    return None if x is None else round(x, n)
+
 def clamp(v, lo, hi):
     return lo if v < lo else hi if v > hi else v
 
@@ -135,19 +183,26 @@ def _start_export_http_server(port: int = 8000):
 # History helpers
 # -----------------------------
 def list_session_summaries(limit: int = 20):
-    rows = []
     try:
-        entries = os.listdir(SESS_DIR)
+        limit = int(limit)
+    except Exception:
+        limit = 20
+    limit = max(1, min(200, limit))
+
+    try:
+        with os.scandir(SESS_DIR) as it:
+            entries = [e for e in it if e.name.startswith("session_") and e.is_dir()]
     except Exception:
         entries = []
 
-    for name in entries:
-        if not name.startswith("session_"):
-            continue
-        sdir = os.path.join(SESS_DIR, name)
-        if not os.path.isdir(sdir):
-            continue
-        summary_path = os.path.join(sdir, "summary.json")
+    # session ids are UTC start timestamps, so name order is newest-first
+    # and only the summaries we return need to be opened
+    entries.sort(key=lambda e: e.name, reverse=True)
+
+    rows = []
+    for entry in entries:
+        name = entry.name
+        summary_path = os.path.join(entry.path, "summary.json")
         summary = _read_json(summary_path)
         if not isinstance(summary, dict):
             continue
@@ -166,18 +221,10 @@ def list_session_summaries(limit: int = 20):
             "speed_loss_pct": summary.get("speed_loss_pct"),
             "_summary_path": summary_path
         })
+        if len(rows) >= limit:
+            break
 
-    def sort_key(r):
-        return (r.get("end_time") or r.get("start_time") or "")
-
-    rows.sort(key=sort_key, reverse=True)
-
-    try:
-        limit = int(limit)
-    except Exception:
-        limit = 20
-    limit = max(1, min(200, limit))
-    return rows[:limit]
+    return rows
 
 def get_session_detail(session_id: str):
     if not session_id:
@@ -187,11 +234,6 @@ def get_session_detail(session_id: str):
     summary = _read_json(summary_path)
     if isinstance(summary, dict):
         return summary
-    for r in list_session_summaries(limit=200):
-        if r.get("session_id") == session_id:
-            summary = _read_json(r.get("_summary_path"))
-            if isinstance(summary, dict):
-                return summary
     return None
 
 def read_session_raw_points(session_id: str, limit: int = 2000, stride: int = 5):
@@ -213,15 +255,17 @@ def read_session_raw_points(session_id: str, limit: int = 2000, stride: int = 5)
         stride = 5
     stride = max(1, min(100, stride))
 
+    # binary lines: skipped lines are never decoded, and loads() takes
+    # bytes (trailing newline is just whitespace to the parser)
     i = 0
-    with open(raw_path, "r", encoding="utf-8") as f:
+    with open(raw_path, "rb") as f:
         for line in f:
             i += 1
             if stride > 1 and (i % stride != 0):
                 continue
             try:
-                msg = json.loads(line.strip())
-            except Exception:
+                msg = loads(line)
+            except (ValueError, RecursionError):
                 continue
 
             t = msg.get("t")
@@ -246,6 +290,44 @@ def read_session_raw_points(session_id: str, limit: int = 2000, stride: int = 5)
 
     return points
 
+def session_raw_reply(session_id: str, limit, stride) -> str:
+    """
+    Encoded session_raw reply. The app re-requests the same session after
+    reconnects; while raw.jsonl is unchanged the previous reply is resent
+    instead of re-parsing and re-encoding thousands of points.
+    """
+    global _raw_reply_key, _raw_reply_json
+    raw_path = os.path.join(SESS_DIR, f"session_{session_id}", "raw.jsonl")
+    try:
+        st = os.stat(raw_path)
+        key = (session_id, limit, stride, st.st_size, st.st_mtime_ns)
+    except OSError:
+        key = None
+    if key is not None and key == _raw_reply_key:
+        return _raw_reply_json
+
+    pts = read_session_raw_points(session_id, limit=limit, stride=stride)
+    if pts is None:
+        return dumps({
+            "type": "session_raw",
+            "ok": False,
+            "error": "not_found",
+            "session_id": session_id
+        })
+
+    reply = dumps({
+        "type": "session_raw",
+        "ok": True,
+        "session_id": session_id,
+        "count": len(pts),
+        "stride": int(stride),
+        "points": pts
+    })
+    if key is not None:
+        _raw_reply_key = key
+        _raw_reply_json = reply
+    return reply
+
 
 # -----------------------------
 # Export helper
@@ -261,20 +343,26 @@ def export_session_zip(session_id: str, device_info: dict, thresholds: dict):
     if not (os.path.exists(summary_path) and os.path.exists(raw_path)):
         return None, None
 
+    # only exports need zipfile (and the zlib/struct machinery behind it);
+    # keep it off the server's startup path
+    import zipfile
+
     filename = f"export_{session_id}.zip"
     zip_path = os.path.join(EXPORT_DIR, filename)
 
     meta = {
         "session_id": session_id,
-        "device_info": json_safe(device_info or {}),
-        "thresholds": json_safe(thresholds or {}),
+        "device_info": device_info or {},
+        "thresholds": thresholds or {},
         "created_utc": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
     }
 
     tmp = zip_path + ".tmp"
     with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as z:
         z.write(summary_path, arcname="summary.json")
-        z.write(raw_path, arcname="raw.jsonl")
+        # raw.jsonl is the bulk of the export; repetitive JSON text still
+        # deflates well at level 1 for a fraction of the default's CPU
+        z.write(raw_path, arcname="raw.jsonl", compresslevel=1)
         z.writestr("meta.json", json.dumps(meta, indent=2))
 
     os.replace(tmp, zip_path)
@@ -291,14 +379,22 @@ class Session:
         self.session_dir = None
         self.raw_path = None
         self.summary_path = None
-        self.f = None
+        self.fd = None
+        self._log_buf = bytearray()
+        self._log_flushed_at = 0.0
+        self._log_writer = None
+        self._log_write_failed = False
         self.start_ts = None
         self.end_ts = None
+        self.reset_metrics()
+
+    def reset_metrics(self):
         self.reps = 0
 
         # metrics
         self.moving_time = 0.0
         self.rep_times = []
+        self._rep_time_sum = 0.0
         self.rep_breakdown = []
         self._last_motion_t = None
         self._last_rep_event_t = None
@@ -309,6 +405,7 @@ class Session:
 
         # velocity proxy (from gyro signal window)
         self.speed_proxy_per_rep = []
+        self._speed_proxy_sum = 0.0
         self._current_rep_speed_peak = 0.0
         self._current_rep_speed_sum = 0.0
         self._current_rep_speed_n = 0
@@ -323,43 +420,61 @@ class Session:
         self.raw_path = os.path.join(sdir, "raw.jsonl")
         self.summary_path = os.path.join(sdir, "summary.json")
 
-        self.f = open(self.raw_path, "w", buffering=1, encoding="utf-8")
+        self.fd = os.open(self.raw_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+        self._log_buf = bytearray()
+        self._log_flushed_at = time.monotonic()
+        # single worker keeps chunks in order
+        self._log_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-log")
+        self._log_write_failed = False
         self.start_ts = time.time()
         self.end_ts = None
-        self.reps = 0
         self.active = True
-
-        self.moving_time = 0.0
-        self.rep_times = []
-        self.rep_breakdown = []
-        self._last_motion_t = None
-        self._last_rep_event_t = None
-
-        self.peak_gyro_per_rep = []
-        self._current_rep_peak = 0.0
-
-        self.speed_proxy_per_rep = []
-        self._current_rep_speed_peak = 0.0
-        self._current_rep_speed_sum = 0.0
-        self._current_rep_speed_n = 0
+        self.reset_metrics()
 
     def stop(self):
         self.end_ts = time.time()
-        if self.f:
+        if self.fd is not None:
+            self.flush_log()
+            # queued chunks must land before the fd is closed
+            self._log_writer.shutdown(wait=True)
+            self._log_writer = None
             try:
-                self.f.close()
+                os.close(self.fd)
             except Exception:
                 pass
-        self.f = None
+        self.fd = None
         self.active = False
         self._last_motion_t = None
 
-    def log(self, msg: dict):
-        if self.active and self.f:
-            try:
-                self.f.write(json.dumps(msg) + "\n")
-            except Exception:
-                pass
+    def log(self, msg: dict, data: str = None):
+        """data: msg already encoded (e.g. for broadcast), to skip a re-encode."""
+        if not (self.active and self.fd is not None):
+            return
+        try:
+            line = (dumps(msg) if data is None else data).encode("utf-8")
+        except Exception:
+            return
+        buf = self._log_buf
+        buf += line
+        buf += b"\n"
+        # one write per ~1 s (or 8 KiB) instead of a flush per line
+        if len(buf) >= LOG_FLUSH_BYTES or time.monotonic() - self._log_flushed_at >= LOG_FLUSH_SEC:
+            self.flush_log()
+
+    def flush_log(self):
+        self._log_flushed_at = time.monotonic()
+        if not self._log_buf:
+            return
+        # hand off a snapshot; failed chunks are dropped, the first one reported
+        fut = self._log_writer.submit(write_all, self.fd, bytes(self._log_buf))
+        fut.add_done_callback(self._on_log_write)
+        self._log_buf.clear()
+
+    def _on_log_write(self, fut):
+        err = fut.exception()
+        if err is not None and not self._log_write_failed:
+            self._log_write_failed = True
+            print(f"raw.jsonl write failed ({self.raw_path}): {err}")
 
     def update_tut(self, mapped_state: str, t: float):
         if not self.active:
@@ -409,6 +524,7 @@ class Session:
             avg = float(round(self._current_rep_speed_sum / self._current_rep_speed_n, 2))
 
         self.speed_proxy_per_rep.append(peak)
+        self._speed_proxy_sum += peak
 
         # reset window accumulators
         self._current_rep_speed_peak = 0.0
@@ -423,18 +539,19 @@ class Session:
             if 0.0 < dt < 20.0:
                 tempo = float(round(dt, 3))
                 self.rep_times.append(dt)
+                self._rep_time_sum += dt
         self._last_rep_event_t = t
         return tempo
 
     def compute_avg_tempo(self):
         if not self.rep_times:
             return None
-        return sum(self.rep_times) / len(self.rep_times)
+        return self._rep_time_sum / len(self.rep_times)
 
     def compute_avg_peak_speed_proxy(self):
         if not self.speed_proxy_per_rep:
             return None
-        return sum(self.speed_proxy_per_rep) / len(self.speed_proxy_per_rep)
+        return self._speed_proxy_sum / len(self.speed_proxy_per_rep)
 
     def write_summary(self, device_info: dict, thresholds: dict):
         if not self.session_dir:
@@ -458,26 +575,30 @@ class Session:
 
             "total_reps": int(self.reps),
 
-            "tut_sec": round(float(self.moving_time), 3),
-            "avg_tempo_sec": None if avg_tempo is None else round(float(avg_tempo), 3),
-            "rep_times_sec": [round(float(x), 3) for x in self.rep_times],
+            "tut_sec": round(self.moving_time, 3),
+            "avg_tempo_sec": round_or_none(avg_tempo, 3),
+            "rep_times_sec": [round(x, 3) for x in self.rep_times],
             "rep_breakdown": self.rep_breakdown,
 
-            "peak_gyro_per_rep": [round(float(x), 2) for x in self.peak_gyro_per_rep],
+            "peak_gyro_per_rep": list(self.peak_gyro_per_rep),
             "output_loss_pct": output_loss,
 
             # velocity proxy
-            "speed_proxy_per_rep": [round(float(x), 2) for x in self.speed_proxy_per_rep],
-            "avg_peak_speed_proxy": None if avg_peak_speed is None else round(float(avg_peak_speed), 2),
+            "speed_proxy_per_rep": list(self.speed_proxy_per_rep),
+            "avg_peak_speed_proxy": round_or_none(avg_peak_speed, 2),
             "speed_loss_pct": speed_loss,
 
-            "device_info": json_safe(device_info or {}),
-            "thresholds": json_safe(thresholds or {}),
+            "device_info": device_info or {},
+            "thresholds": thresholds or {},
         }
 
+        # encode up front and write once (json.dump issues a write per token);
+        # O_DSYNC makes the data durable before the rename publishes it
+        data = json.dumps(summary, indent=2).encode("utf-8")
         tmp = self.summary_path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_DSYNC", 0), 0o644)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
         os.replace(tmp, self.summary_path)
         return self.summary_path
 
@@ -485,18 +606,31 @@ class Session:
 session = Session()
 
 
-async def broadcast(msg: dict):
+def last_status_json() -> str:
+    global _last_status_json
+    if _last_status_json is None:
+        _last_status_json = dumps({**LAST_STATUS, "type": "status"})
+    return _last_status_json
+
+
+def send_backlog(ws) -> int:
+    transport = safe_getattr(ws, "transport", None)
+    try:
+        return transport.get_write_buffer_size()
+    except AttributeError:
+        return 0
+
+async def broadcast(msg: dict, data: str = None):
     if not clients:
         return
-    data = json.dumps(msg)
-    dead = []
-    for ws in list(clients):
-        try:
-            await ws.send(data)
-        except Exception:
-            dead.append(ws)
-    for ws in dead:
-        clients.discard(ws)
+    targets = clients
+    if msg.get("type") == "rep_update":
+        targets = [ws for ws in clients if send_backlog(ws) <= SLOW_CLIENT_BACKLOG_BYTES]
+        if not targets:
+            return
+    # encode once; websockets writes the same frame to every open client
+    # without awaiting each one, so a slow client can't stall the IMU loop
+    websockets.broadcast(targets, dumps(msg) if data is None else data)
 
 
 # -----------------------------
@@ -508,12 +642,12 @@ async def handle_client(ws):
     print("Client connected")
 
     try:
-        await ws.send(json.dumps(LAST_STATUS))
+        await ws.send(last_status_json())
 
         async for raw in ws:
             try:
-                msg = json.loads(raw)
-            except Exception:
+                msg = loads(raw)
+            except (ValueError, RecursionError):
                 continue
 
             if not isinstance(msg, dict) or not is_command_message(msg):
@@ -524,14 +658,14 @@ async def handle_client(ws):
             if action == "start":
                 if not session.active:
                     session.start()
-                    await ws.send(json.dumps({
+                    await ws.send(dumps({
                         "type": "ack", "action": "start", "ok": True,
                         "session_id": session.session_id,
                         "dir": session.session_dir,
                         "file": session.raw_path
                     }))
                 else:
-                    await ws.send(json.dumps({
+                    await ws.send(dumps({
                         "type": "ack", "action": "start", "ok": True,
                         "note": "already_active",
                         "session_id": session.session_id
@@ -545,33 +679,33 @@ async def handle_client(ws):
                     avg_tempo = session.compute_avg_tempo()
                     avg_peak_speed = session.compute_avg_peak_speed_proxy()
 
-                    await ws.send(json.dumps({
+                    await ws.send(dumps({
                         "type": "ack", "action": "stop", "ok": True,
                         "session_id": session.session_id,
                         "reps": int(session.reps),
                         "summary": summary_path
                     }))
 
-                    await ws.send(json.dumps({
+                    await ws.send(dumps({
                         "type": "session_summary",
                         "session_id": session.session_id,
                         "total_reps": int(session.reps),
 
-                        "tut_sec": round(float(session.moving_time), 3),
-                        "avg_tempo_sec": None if avg_tempo is None else round(float(avg_tempo), 3),
-                        "rep_times_sec": [round(float(x), 3) for x in session.rep_times],
+                        "tut_sec": round(session.moving_time, 3),
+                        "avg_tempo_sec": round_or_none(avg_tempo, 3),
+                        "rep_times_sec": [round(x, 3) for x in session.rep_times],
                         "rep_breakdown": session.rep_breakdown,
 
                         "output_loss_pct": compute_loss_pct(session.peak_gyro_per_rep),
 
-                        "speed_proxy_per_rep": [round(float(x), 2) for x in session.speed_proxy_per_rep],
-                        "avg_peak_speed_proxy": None if avg_peak_speed is None else round(float(avg_peak_speed), 2),
+                        "speed_proxy_per_rep": list(session.speed_proxy_per_rep),
+                        "avg_peak_speed_proxy": round_or_none(avg_peak_speed, 2),
                         "speed_loss_pct": compute_loss_pct(session.speed_proxy_per_rep),
 
                         "summary_path": summary_path
                     }))
                 else:
-                    await ws.send(json.dumps({
+                    await ws.send(dumps({
                         "type": "ack", "action": "stop", "ok": True,
                         "note": "already_inactive",
                         "reps": int(session.reps)
@@ -579,7 +713,7 @@ async def handle_client(ws):
 
             elif action == "reset":
                 RESET_REQUESTED = True
-                await ws.send(json.dumps({"type": "ack", "action": "reset", "ok": True}))
+                await ws.send(dumps({"type": "ack", "action": "reset", "ok": True}))
 
             elif action == "list_sessions":
                 limit = msg.get("limit", 20)
@@ -598,7 +732,7 @@ async def handle_client(ws):
                         "avg_peak_speed_proxy": r.get("avg_peak_speed_proxy"),
                         "speed_loss_pct": r.get("speed_loss_pct"),
                     })
-                await ws.send(json.dumps({
+                await ws.send(dumps({
                     "type": "sessions_list",
                     "count": len(sessions_out),
                     "sessions": sessions_out
@@ -608,14 +742,14 @@ async def handle_client(ws):
                 sid = msg.get("session_id")
                 detail = get_session_detail(sid)
                 if detail is None:
-                    await ws.send(json.dumps({
+                    await ws.send(dumps({
                         "type": "session_detail",
                         "ok": False,
                         "error": "not_found",
                         "session_id": sid
                     }))
                 else:
-                    await ws.send(json.dumps({
+                    await ws.send(dumps({
                         "type": "session_detail",
                         "ok": True,
                         "session_id": sid,
@@ -626,23 +760,7 @@ async def handle_client(ws):
                 sid = msg.get("session_id")
                 limit = msg.get("limit", 2000)
                 stride = msg.get("stride", 5)
-                pts = read_session_raw_points(sid, limit=limit, stride=stride)
-                if pts is None:
-                    await ws.send(json.dumps({
-                        "type": "session_raw",
-                        "ok": False,
-                        "error": "not_found",
-                        "session_id": sid
-                    }))
-                else:
-                    await ws.send(json.dumps({
-                        "type": "session_raw",
-                        "ok": True,
-                        "session_id": sid,
-                        "count": len(pts),
-                        "stride": int(stride),
-                        "points": pts
-                    }))
+                await ws.send(session_raw_reply(sid, limit, stride))
 
             elif action == "export_session":
                 sid = msg.get("session_id")
@@ -656,7 +774,7 @@ async def handle_client(ws):
                 )
 
                 if zip_path is None:
-                    await ws.send(json.dumps({
+                    await ws.send(dumps({
                         "type": "export_result",
                         "ok": False,
                         "error": "not_found",
@@ -667,7 +785,7 @@ async def handle_client(ws):
                     if start_http:
                         served_port = _start_export_http_server(http_port)
 
-                    await ws.send(json.dumps({
+                    await ws.send(dumps({
                         "type": "export_result",
                         "ok": True,
                         "session_id": sid,
@@ -687,12 +805,15 @@ async def handle_client(ws):
 # IMU loop
 # -----------------------------
 async def imu_loop():
-    global LAST_STATUS, RESET_REQUESTED, SERVER_DEVICE_INFO, SERVER_THRESHOLDS
+    global LAST_STATUS, RESET_REQUESTED, SERVER_DEVICE_INFO, SERVER_THRESHOLDS, _last_status_json
 
     THRESHOLD = 1200.0
     MIN_REP_TIME = 0.6
     ALPHA = 0.2
 
+    SAMPLE_PERIOD = 0.02  # 50 Hz IMU reads
+    SEND_PERIOD = 0.1     # 10 Hz rep_update
+
     SERVER_THRESHOLDS = {
         "threshold": THRESHOLD,
         "min_rep_time_sec": MIN_REP_TIME,
@@ -738,46 +859,49 @@ async def imu_loop():
     session_counter = RepCounter(threshold=THRESHOLD, min_rep_time=MIN_REP_TIME, alpha=ALPHA)
 
     calib_secs = 2.0
-    calib_start = time.time()
+    calib_start = time.monotonic()
 
-    t0 = time.time()
-    last_send = 0.0
+    # monotonic clock: NTP steps on the Pi must not jump t or the schedule
+    t0 = time.monotonic()
+    next_tick = t0
+    next_send = SEND_PERIOD
     was_recording = False
     last_session_reps = 0
 
     consecutive_failures = 0
     last_error_sent = 0.0
 
+    # I2C reads off the event loop, one at a time
+    loop = asyncio.get_running_loop()
+    imu_reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="imu")
+
+    # hot-path lookups
+    monotonic = time.monotonic
+    run_in_executor = loop.run_in_executor
+    read_imu = imu.read_accel_gyro
+    update_tut = session.update_tut
+    update_peak = session.update_peak
+    update_speed_proxy = session.update_speed_proxy
+
     try:
         while True:
-            t = time.time() - t0
+            now = monotonic()
+            t = now - t0
 
             if RESET_REQUESTED:
                 live_counter = RepCounter(threshold=THRESHOLD, min_rep_time=MIN_REP_TIME, alpha=ALPHA)
                 session_counter = RepCounter(threshold=THRESHOLD, min_rep_time=MIN_REP_TIME, alpha=ALPHA)
 
-                session.reps = 0
-                session.moving_time = 0.0
-                session.rep_times = []
-                session.rep_breakdown = []
-                session.peak_gyro_per_rep = []
-                session.speed_proxy_per_rep = []
-                session._last_motion_t = None
-                session._last_rep_event_t = None
-                session._current_rep_peak = 0.0
-                session._current_rep_speed_peak = 0.0
-                session._current_rep_speed_sum = 0.0
-                session._current_rep_speed_n = 0
+                session.reset_metrics()
 
                 last_session_reps = 0
                 RESET_REQUESTED = False
 
             try:
-                ax, ay, az, gx, gy, gz = imu.read_accel_gyro()
+                ax, ay, az, gx, gy, gz = await run_in_executor(imu_reader, read_imu)
                 consecutive_failures = 0
             except OSError as e:
                 consecutive_failures += 1
-                now = time.time()
                 if now - last_error_sent > 1.0:
                     last_error_sent = now
                     await broadcast({
@@ -798,30 +922,19 @@ async def imu_loop():
                 continue
 
             _lr, live_filt, live_state = live_counter.update(gx, gy, gz, t)
-            mapped = STATE_MOVING if live_state == "MOVING" else STATE_WAITING
-            ui_state = STATE_CALIBRATING if (time.time() - calib_start < calib_secs) else mapped
+            mapped = STATE_MOVING if live_state == COUNTER_MOVING else STATE_WAITING
+            ui_state = STATE_CALIBRATING if (now - calib_start < calib_secs) else mapped
 
             live_abs = abs(float(live_filt))
 
             # metrics only during recording
-            session.update_tut(mapped, t)
-            session.update_peak(live_abs)
-            session.update_speed_proxy(live_abs)
+            update_tut(mapped, t)
+            update_peak(live_abs)
+            update_speed_proxy(live_abs)
 
             if session.active and not was_recording:
                 session_counter = RepCounter(threshold=THRESHOLD, min_rep_time=MIN_REP_TIME, alpha=ALPHA)
-                session.reps = 0
-                session.moving_time = 0.0
-                session.rep_times = []
-                session.rep_breakdown = []
-                session.peak_gyro_per_rep = []
-                session.speed_proxy_per_rep = []
-                session._last_motion_t = None
-                session._last_rep_event_t = None
-                session._current_rep_peak = 0.0
-                session._current_rep_speed_peak = 0.0
-                session._current_rep_speed_sum = 0.0
-                session._current_rep_speed_n = 0
+                session.reset_metrics()
                 last_session_reps = 0
 
             was_recording = session.active
@@ -839,13 +952,14 @@ async def imu_loop():
                     # velocity proxy per rep
                     peak_speed, avg_speed = session.finalize_speed_proxy()
 
-                    confidence = min(1.0, max(0.0, live_abs / 2000.0))
+                    confidence = round(min(1.0, max(0.0, live_abs / 2000.0)), 2)
+                    t3 = round(t, 3)
 
                     rep_event = {
                         "type": "rep_event",
                         "rep": int(reps),
-                        "t": round(t, 3),
-                        "confidence": round(confidence, 2),
+                        "t": t3,
+                        "confidence": confidence,
 
                         "tempo_sec": tempo,
                         "peak_gyro": peak_gyro,
@@ -854,25 +968,26 @@ async def imu_loop():
                         "peak_speed_proxy": peak_speed,
                         "avg_speed_proxy": avg_speed
                     }
-                    await broadcast(rep_event)
-                    session.log(rep_event)
+                    data = dumps(rep_event)
+                    await broadcast(rep_event, data)
+                    session.log(rep_event, data)
 
                     # also store into breakdown for summary screen
                     bd = {
                         "rep": int(reps),
-                        "t": round(t, 3),
+                        "t": t3,
                         "tempo_sec": tempo,
                         "peak_speed_proxy": peak_speed,
                         "avg_speed_proxy": avg_speed,
                         "peak_gyro": peak_gyro,
-                        "confidence": round(confidence, 2),
+                        "confidence": confidence,
                     }
                     session.rep_breakdown.append(bd)
 
                 session.reps = int(reps)
                 last_session_reps = int(reps)
 
-            if t - last_send >= 0.1:
+            if t >= next_send:
                 avg_tempo = session.compute_avg_tempo()
                 avg_peak_speed = session.compute_avg_peak_speed_proxy()
 
@@ -882,28 +997,43 @@ async def imu_loop():
                     "reps": int(session.reps),
                     "state": ui_state,
                     "recording": bool(session.active),
-                    "gyro_filt": round(float(live_filt), 1),
+                    "gyro_filt": round(live_filt, 1),
 
-                    "tut_sec": round(float(session.moving_time), 2),
-                    "avg_tempo_sec": None if avg_tempo is None else round(float(avg_tempo), 2),
+                    "tut_sec": round(session.moving_time, 2),
+                    "avg_tempo_sec": round_or_none(avg_tempo, 2),
 
                     "output_loss_pct": compute_loss_pct(session.peak_gyro_per_rep),
 
                     # NEW:
-                    "avg_peak_speed_proxy": None if avg_peak_speed is None else round(float(avg_peak_speed), 2),
+                    "avg_peak_speed_proxy": round_or_none(avg_peak_speed, 2),
                     "speed_loss_pct": compute_loss_pct(session.speed_proxy_per_rep),
                 }
 
-                LAST_STATUS = dict(payload)
-                LAST_STATUS["type"] = "status"
-
-                await broadcast(payload)
-                session.log(payload)
-                last_send = t
-
-            await asyncio.sleep(0.02)
+                LAST_STATUS = payload
+                _last_status_json = None
+
+                # one encode shared by the wire and the raw log
+                data = dumps(payload) if (clients or session.active) else None
+                await broadcast(payload, data)
+                session.log(payload, data)
+                next_send += SEND_PERIOD
+                if next_send <= t:
+                    next_send = t + SEND_PERIOD
+
+            # 50 Hz tick; after a slow read, restart the schedule from now
+            next_tick += SAMPLE_PERIOD
+            delay = next_tick - monotonic()
+            if delay < 0.0:
+                next_tick = monotonic()
+                delay = 0.0
+            await asyncio.sleep(delay)
 
     finally:
+        # let an in-flight read finish before the bus is closed
+        imu_reader.shutdown(wait=True)
+        # Ctrl+C lands here; flush the tail of an active recording
+        if session.active:
+            session.stop()
         try:
             imu.close()
         except Exception:
@@ -925,4 +1055,10 @@ async def main():
     await server.wait_closed()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None and hasattr(uvloop, "run"):
+        uvloop.run(main())
+    else:
+        # uvloop < 0.18 (e.g. the bookworm package) has no run()
+        if uvloop is not None:
+            uvloop.install()
+        asyncio.run(main())
\ No newline at end of file